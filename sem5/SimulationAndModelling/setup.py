@@ -0,0 +1,5 @@
+# Builds the optional compiled step kernel: python setup.py build_ext --inplace
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(ext_modules=cythonize("firestep.pyx"))
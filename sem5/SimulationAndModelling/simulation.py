@@ -1,8 +1,21 @@
 import pygame
 import numpy as np
 from enum import IntEnum
+from functools import lru_cache
 import math
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # Numba is optional - the vectorized NumPy step is used instead
+    HAS_NUMBA = False
+
+try:
+    import firestep  # Optional Cython kernel, built with: python setup.py build_ext --inplace
+    HAS_FIRESTEP = True
+except ImportError:
+    HAS_FIRESTEP = False
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONSTANTS & CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -10,6 +23,9 @@ CELL_STATES = IntEnum('CellState', {'EMPTY': 0, 'TREE': 1, 'BURNING': 2, 'BURNT'
 GRID_WIDTH, GRID_HEIGHT = 120, 80
 PANEL_WIDTH = 320
 FPS, SIMULATION_SPEED = 60, 3
+NEIGHBORS = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+NEIGHBOR_DY, NEIGHBOR_DX = np.array([d[0] for d in NEIGHBORS]), np.array([d[1] for d in NEIGHBORS])
+TREE, BURNING, BURNT = int(CELL_STATES.TREE), int(CELL_STATES.BURNING), int(CELL_STATES.BURNT)
 
 # Premium light theme - clean and breathable
 COLORS = {
@@ -24,63 +40,148 @@ COLORS = {
 # ═══════════════════════════════════════════════════════════════════════════════
 # HELPER FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════
-def clamp(val, lo, hi): return max(lo, min(hi, val))
 def lerp(a, b, t): return a + (b - a) * t
 def ease_out_cubic(t): return 1 - pow(1 - t, 3)
 
+@lru_cache(maxsize=64)
+def _make_rounded_surf(w, h, color, alpha, radius):
+    """Translucent rounded rect sprite, shared by every draw with the same look"""
+    temp = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.rect(temp, (*color, alpha), temp.get_rect(), border_radius=radius)
+    return temp
+
 def draw_rounded_rect(surface, color, rect, radius=8, alpha=255):
     """Efficient rounded rectangle with optional alpha"""
     if alpha < 255:
-        temp = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(temp, (*color, alpha), temp.get_rect(), border_radius=radius)
-        surface.blit(temp, rect.topleft)
+        surface.blit(_make_rounded_surf(rect.width, rect.height, tuple(color), alpha, radius), rect.topleft)
     else:
         pygame.draw.rect(surface, color, rect, border_radius=radius)
 
+_glow_cache = {}  # (color, radius, glow_radius) -> pre-rendered glow Surface
+
+def _make_glow_surface(color, radius, glow_radius):
+    """Composite all glow rings into one RGBA sprite with NumPy"""
+    s = radius + glow_radius + 1
+    yy, xx = np.ogrid[-s:s + 1, -s:s + 1]
+    d = np.sqrt(xx * xx + yy * yy)
+    # Same-colored rings stacked with alpha a_i leave Π(1 - a_i) of the background showing
+    keep = np.ones(d.shape)
+    for i in range(glow_radius, 0, -1):
+        keep *= np.where(d <= radius + i, 1 - int(40 * (1 - i / glow_radius)) / 255, 1.0)
+    rgba = np.empty((*d.shape, 4), dtype=np.uint8)
+    rgba[..., :3], rgba[..., 3] = color, np.round(255 * (1 - keep))
+    return pygame.image.frombuffer(rgba.tobytes(), rgba.shape[1::-1], 'RGBA').convert_alpha()
+
 def draw_glow_circle(surface, color, center, radius, glow_radius=4):
     """Draw circle with subtle glow effect"""
-    for i in range(glow_radius, 0, -1):
-        alpha = int(40 * (1 - i / glow_radius))
-        temp = pygame.Surface((radius * 2 + i * 4, radius * 2 + i * 4), pygame.SRCALPHA)
-        pygame.draw.circle(temp, (*color, alpha), (radius + i * 2, radius + i * 2), radius + i)
-        surface.blit(temp, (center[0] - radius - i * 2, center[1] - radius - i * 2))
+    key = (tuple(color), radius, glow_radius)
+    glow = _glow_cache.get(key)
+    if glow is None: glow = _glow_cache[key] = _make_glow_surface(*key)
+    half = glow.get_width() // 2
+    surface.blit(glow, (center[0] - half, center[1] - half))
     pygame.draw.circle(surface, color, center, radius)
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# UI COMPONENTS
+# SIMULATION KERNELS
 # ═══════════════════════════════════════════════════════════════════════════════
-class Slider:
-    """Premium slider with smooth interactions"""
-    def __init__(self, x, y, w, h, min_v, max_v, val, label, key):
-        self.rect, self.min_v, self.max_v, self.val = pygame.Rect(x, y, w, h), min_v, max_v, val
-        self.label, self.key, self.dragging = label, key, False
+def _simulate_step_np(padded, new, fire_prob, moisture, bias8, rand):
+    """Vectorized update: each tree ignites with 1 - Π(1 - p) over its burning neighbors"""
+    H, W = new.shape
+    grid = padded[1:-1, 1:-1]
+    burning = padded == BURNING
+    p_no_ignite = np.ones((H, W), dtype=np.float32)  # float32 keeps the memory-bound passes at half width
+    
+    for k, (dy, dx) in enumerate(NEIGHBORS):
+        # Window of cells at (y - dy, x - dx); the EMPTY border stands in for off-grid sources
+        keep = np.float32(1 - min(1.0, fire_prob * bias8[k] * (1 - moisture)))
+        p_no_ignite *= np.where(burning[1 - dy:1 - dy + H, 1 - dx:1 - dx + W], keep, np.float32(1))
     
-    def handle_x(self): return int(self.rect.x + (self.val - self.min_v) / (self.max_v - self.min_v) * self.rect.width)
+    ignite = (grid == TREE) & (rand < 1 - p_no_ignite)
+    np.copyto(new, grid)
+    new[burning[1:-1, 1:-1]] = BURNT
+    new[ignite] = BURNING
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _simulate_step_nb(padded, new, fire_prob, moisture, bias8, rand):
+        """Compiled update, rows spread across cores (first call pays the JIT cost)"""
+        H, W = new.shape
+        for y in prange(H):
+            for x in range(W):
+                cell = padded[y + 1, x + 1]
+                if cell == BURNING: cell = BURNT
+                elif cell == TREE:
+                    # Gather from burning neighbors so each row only writes its own cells
+                    p_no_ignite = 1.0
+                    for k in range(8):
+                        if padded[y + 1 - NEIGHBOR_DY[k], x + 1 - NEIGHBOR_DX[k]] == BURNING:
+                            p_no_ignite *= 1.0 - min(1.0, fire_prob * bias8[k] * (1 - moisture))
+                    if rand[y, x] < 1.0 - p_no_ignite: cell = BURNING
+                new[y, x] = cell
+
+def get_step_kernel():
+    """Fastest available kernel: compiled extension, then Numba, then NumPy"""
+    if HAS_FIRESTEP: return firestep.step
+    return _simulate_step_nb if HAS_NUMBA else _simulate_step_np
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# UI COMPONENTS
+# ═══════════════════════════════════════════════════════════════════════════════
+class SliderBank:
+    """Premium sliders stored as parallel arrays so each event is hit-tested in one pass"""
+    def __init__(self, specs):
+        # specs: (x, y, w, h, min_v, max_v, val, label) per slider
+        self.rects = np.array([spec[:4] for spec in specs], dtype=np.int32)  # x, y, w, h
+        self.min_v, self.max_v, self.vals = (np.array([spec[i] for spec in specs], dtype=np.float64) for i in (4, 5, 6))
+        self.labels = [spec[7] for spec in specs]
+        self.dragging = np.zeros(len(specs), dtype=bool)
+        # Last value text and its rendered Surface per slider - re-rendered only when the text changes
+        self._val_texts, self._val_surfs = [None] * len(specs), [None] * len(specs)
     
-    def update_val(self, mx): self.val = clamp(self.min_v + (mx - self.rect.x) / self.rect.width * (self.max_v - self.min_v), self.min_v, self.max_v)
+    def update_vals(self, mx, mask):
+        """Set every slider selected by mask from mouse x in one clipped pass"""
+        vals = self.min_v + (mx - self.rects[:, 0]) / self.rects[:, 2] * (self.max_v - self.min_v)
+        np.copyto(self.vals, np.clip(vals, self.min_v, self.max_v), where=mask)
     
-    def handle_event(self, e):
-        if e.type == pygame.MOUSEBUTTONDOWN and self.rect.inflate(20, 20).collidepoint(e.pos):
-            self.dragging = True; self.update_val(e.pos[0]); return True
-        if e.type == pygame.MOUSEBUTTONUP: self.dragging = False
-        if e.type == pygame.MOUSEMOTION and self.dragging: self.update_val(e.pos[0]); return True
+    def handle_event_all(self, e):
+        if e.type == pygame.MOUSEBUTTONDOWN:
+            # Same hit area as Rect.inflate(20, 20).collidepoint, for every slider at once
+            mx, my = e.pos
+            x, y, w, h = self.rects.T
+            hits = (mx >= x - 10) & (mx < x + w + 10) & (my >= y - 10) & (my < y + h + 10)
+            self.dragging |= hits
+            self.update_vals(mx, hits)
+            return bool(hits.any())
+        if e.type == pygame.MOUSEBUTTONUP: self.dragging[:] = False
+        if e.type == pygame.MOUSEMOTION and self.dragging.any():
+            self.update_vals(e.pos[0], self.dragging)
+            return True
         return False
     
-    def draw(self, surf, font, small_font):
-        # Track background with rounded ends
-        pygame.draw.rect(surf, COLORS['SLIDER_BG'], self.rect, border_radius=4)
-        # Filled portion with gradient feel
-        fill_w = int((self.val - self.min_v) / (self.max_v - self.min_v) * self.rect.width)
-        if fill_w > 0: pygame.draw.rect(surf, COLORS['SLIDER_FILL'], pygame.Rect(self.rect.x, self.rect.y, fill_w, self.rect.height), border_radius=4)
-        # Handle
-        hx = self.handle_x()
-        pygame.draw.circle(surf, COLORS['TEXT'], (hx, self.rect.centery), 7)
-        pygame.draw.circle(surf, COLORS['ACCENT'], (hx, self.rect.centery), 5)
-        # Label
-        surf.blit(font.render(self.label, True, COLORS['TEXT_DIM']), (self.rect.x, self.rect.y - 26))
-        # Value display
-        val_surf = small_font.render(f"{self.val:.2f}", True, COLORS['TEXT_DIM'])
-        surf.blit(val_surf, (self.rect.right - val_surf.get_width(), self.rect.y - 26))
+    def draw_static(self, surf, font, ox=0):
+        """Labels never change - drawn once onto the pre-rendered panel layer"""
+        for (x, y, _, _), label in zip(self.rects.tolist(), self.labels):
+            surf.blit(font.render(label, True, COLORS['TEXT_DIM']), (x - ox, y - 26))
+    
+    def draw(self, surf, small_font):
+        draw_rect, draw_circle, blit, render = pygame.draw.rect, pygame.draw.circle, surf.blit, small_font.render
+        for i, ((x, y, w, h), val, lo, hi) in enumerate(zip(self.rects.tolist(), self.vals.tolist(), self.min_v.tolist(), self.max_v.tolist())):
+            # Track background with rounded ends
+            draw_rect(surf, COLORS['SLIDER_BG'], (x, y, w, h), border_radius=4)
+            # Filled portion with gradient feel
+            fill_w = int((val - lo) / (hi - lo) * w)
+            if fill_w > 0: draw_rect(surf, COLORS['SLIDER_FILL'], (x, y, fill_w, h), border_radius=4)
+            # Handle
+            hx, cy = int(x + (val - lo) / (hi - lo) * w), y + h // 2
+            draw_circle(surf, COLORS['TEXT'], (hx, cy), 7)
+            draw_circle(surf, COLORS['ACCENT'], (hx, cy), 5)
+            # Value display
+            text = f"{val:.2f}"
+            if text != self._val_texts[i]:
+                self._val_texts[i], self._val_surfs[i] = text, render(text, True, COLORS['TEXT_DIM'])
+            val_surf = self._val_surfs[i]
+            blit(val_surf, (x + w - val_surf.get_width(), y - 26))
 
 
 class Button:
@@ -103,45 +204,52 @@ class Button:
 
 class WindCompass:
     """Beautiful wind direction indicator with animated arrow"""
+    # Whole-degree lookups - the arrow never needs finer than the 1° shown under the dial
+    _SIN = [math.sin(math.radians(a)) for a in range(360)]
+    _COS = [math.cos(math.radians(a)) for a in range(360)]
+    
     def __init__(self, x, y, size):
         self.cx, self.cy, self.size = x + size // 2, y + size // 2, size
         self.radius = size // 2 - 20
+        # Cardinal label centers and tick endpoints as offsets from the dial center
+        self._cardinals = []
+        for angle, lbl in [(0, 'N'), (90, 'E'), (180, 'S'), (270, 'W')]:
+            s, c = self._SIN[angle], self._COS[angle]
+            self._cardinals.append((lbl, (self.radius + 14) * s, -(self.radius + 14) * c,
+                                    (self.radius - 6) * s, -(self.radius - 6) * c, self.radius * s, -self.radius * c))
+        self._card_text_surfs = {}  # Rendered on first draw, once a font exists
     
-    def draw(self, surf, font, small_font, direction, strength):
+    def draw_static(self, surf, small_font, ox=0):
+        """Dial rings, cardinal labels and ticks - drawn once onto the pre-rendered panel layer"""
+        cx = self.cx - ox
         # Outer glow ring
-        pygame.draw.circle(surf, COLORS['PANEL_BORDER'], (self.cx, self.cy), self.radius + 3, 2)
-        pygame.draw.circle(surf, COLORS['SLIDER_BG'], (self.cx, self.cy), self.radius, 1)
+        pygame.draw.circle(surf, COLORS['PANEL_BORDER'], (cx, self.cy), self.radius + 3, 2)
+        pygame.draw.circle(surf, COLORS['SLIDER_BG'], (cx, self.cy), self.radius, 1)
         
         # Cardinal directions with styled labels
-        for angle, lbl in [(0, 'N'), (90, 'E'), (180, 'S'), (270, 'W')]:
-            rad = math.radians(angle)
-            tx = self.cx + (self.radius + 14) * math.sin(rad)
-            ty = self.cy - (self.radius + 14) * math.cos(rad)
-            color = COLORS['ACCENT'] if lbl == 'N' else COLORS['TEXT_DIM']
-            lbl_surf = small_font.render(lbl, True, color)
-            surf.blit(lbl_surf, (tx - lbl_surf.get_width() // 2, ty - lbl_surf.get_height() // 2))
+        for lbl, tx, ty, t1x, t1y, t2x, t2y in self._cardinals:
+            if lbl not in self._card_text_surfs:
+                color = COLORS['ACCENT'] if lbl == 'N' else COLORS['TEXT_DIM']
+                self._card_text_surfs[lbl] = small_font.render(lbl, True, color)
+            lbl_surf = self._card_text_surfs[lbl]
+            surf.blit(lbl_surf, (cx + tx - lbl_surf.get_width() // 2, self.cy + ty - lbl_surf.get_height() // 2))
             # Tick marks
-            t1x, t1y = self.cx + (self.radius - 6) * math.sin(rad), self.cy - (self.radius - 6) * math.cos(rad)
-            t2x, t2y = self.cx + self.radius * math.sin(rad), self.cy - self.radius * math.cos(rad)
-            pygame.draw.line(surf, COLORS['PANEL_BORDER'], (t1x, t1y), (t2x, t2y), 2)
-        
+            pygame.draw.line(surf, COLORS['PANEL_BORDER'], (cx + t1x, self.cy + t1y), (cx + t2x, self.cy + t2y), 2)
+    
+    def draw(self, surf, font, small_font, direction, strength):
         # Wind direction arrow with dynamic length
-        wind_rad = math.radians(direction)
+        deg = int(direction) % 360
         arrow_len = self.radius * (0.4 + strength * 0.5)
-        end_x, end_y = self.cx + arrow_len * math.sin(wind_rad), self.cy - arrow_len * math.cos(wind_rad)
+        end_x, end_y = self.cx + arrow_len * self._SIN[deg], self.cy - arrow_len * self._COS[deg]
         
-        # Arrow shaft with glow
-        for i, alpha in enumerate([60, 100, 180]):
-            width = 5 - i
-            temp = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.line(temp, (*COLORS['ACCENT'], alpha), (self.cx - (self.cx - self.size // 2), self.cy - (self.cy - self.size // 2)), (end_x - (self.cx - self.size // 2), end_y - (self.cy - self.size // 2)), width)
+        # Arrow shaft
         pygame.draw.line(surf, COLORS['ACCENT'], (self.cx, self.cy), (end_x, end_y), 3)
         
         # Arrowhead
         head_size = 12
         for offset in [-25, 25]:
-            hx = end_x - head_size * math.sin(wind_rad + math.radians(offset))
-            hy = end_y + head_size * math.cos(wind_rad + math.radians(offset))
+            hx = end_x - head_size * self._SIN[(deg + offset) % 360]
+            hy = end_y + head_size * self._COS[(deg + offset) % 360]
             pygame.draw.line(surf, COLORS['ACCENT'], (end_x, end_y), (hx, hy), 3)
         
         # Center dot
@@ -175,17 +283,35 @@ class ForestFireSimulation:
         self.title_font = pygame.font.SysFont('Segoe UI', 22, bold=True)
         self.stat_font = pygame.font.SysFont('Segoe UI', 14)
         
-        # Simulation state
-        self.grid = np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8)
+        # Cell state -> RGB lookup used to paint the whole grid in one pass
+        self._palette = np.array([COLORS['EMPTY'], COLORS['TREE'], COLORS['BURNING'], COLORS['BURNT']], dtype=np.uint8)
+        # Persistent grid surfaces (one pixel per cell, and scaled to cell size) reused every frame
+        self._grid_surf_small = pygame.Surface((GRID_WIDTH, GRID_HEIGHT)).convert()
+        self._grid_surf_scaled = pygame.Surface((self.grid_px_w, self.grid_px_h)).convert()
+        
+        # Simulation state - double-buffered grids with an EMPTY border so kernels need no edge checks;
+        # self.grid is a view of the front buffer's interior
+        self._padded = np.zeros((GRID_HEIGHT + 2, GRID_WIDTH + 2), dtype=np.uint8)
+        self._padded_back = np.zeros_like(self._padded)
+        self.grid = self._padded[1:-1, 1:-1]
         self.running, self.paused, self.last_step = False, False, 0
+        self._rng = np.random.default_rng()
+        self._step_kernel = get_step_kernel()
+        # One call on the empty buffers so any JIT compile happens at startup, not on the first step
+        self._step_kernel(self._padded, self._padded_back[1:-1, 1:-1], 0.0, 0.0, np.ones(8, dtype=np.float32),
+                          np.zeros(self.grid.shape, dtype=np.float32))
+        self._dirty_rects, self._full_redraw = [], True  # Screen areas to push on the next display update
+        self._stats_dirty, self._stats_cache = True, (0, 0, 0)  # (trees, burning, burnt), recounted on change
         
         # Parameters
         self.tree_density, self.wind_dir, self.wind_str, self.moisture, self.temperature = 0.6, 0.0, 0.5, 0.2, 25.0
         self.fire_prob = 0.3  # Computed from other params
+        self._wind_key = None  # (wind_dir, wind_str) the bias table was built for
         
         # Initialize UI
         self._create_ui()
         self._init_forest()
+        self._sync_params()
     
     def _setup_display(self):
         """Setup fullscreen display with dynamic grid sizing"""
@@ -201,6 +327,7 @@ class ForestFireSimulation:
         
         # Center grid vertically
         self.grid_offset_y = (self.win_h - self.grid_px_h) // 2
+        self._panel_rect = pygame.Rect(self.win_w - PANEL_WIDTH, 0, PANEL_WIDTH, self.win_h)
     
     def _create_ui(self):
         """Create all UI components with proper spacing"""
@@ -210,13 +337,13 @@ class ForestFireSimulation:
         # Sliders with generous vertical spacing
         sy = 90
         sp = 58
-        self.sliders = [
-            Slider(px, sy, pw, 8, 0.1, 0.9, 0.6, "Tree Density", "1"),
-            Slider(px, sy + sp, pw, 8, 0, 360, 0, "Wind Direction", "2"),
-            Slider(px, sy + sp * 2, pw, 8, 0, 1, 0.5, "Wind Strength", "3"),
-            Slider(px, sy + sp * 3, pw, 8, 0, 0.5, 0.2, "Moisture", "4"),
-            Slider(px, sy + sp * 4, pw, 8, 0, 50, 25, "Temperature (°C)", "5"),
-        ]
+        self.sliders = SliderBank([
+            (px, sy, pw, 8, 0.1, 0.9, 0.6, "Tree Density"),
+            (px, sy + sp, pw, 8, 0, 360, 0, "Wind Direction"),
+            (px, sy + sp * 2, pw, 8, 0, 1, 0.5, "Wind Strength"),
+            (px, sy + sp * 3, pw, 8, 0, 0.5, 0.2, "Moisture"),
+            (px, sy + sp * 4, pw, 8, 0, 50, 25, "Temperature (°C)"),
+        ])
         
         # Wind compass centered
         compass_size = 130
@@ -234,21 +361,46 @@ class ForestFireSimulation:
         ]
         
         self.stats_y = by + bs * 5 + 20
+        self._render_panel_static()
+    
+    def _render_panel_static(self):
+        """Pre-render the immutable panel chrome; rerun if the window size or widget layout changes"""
+        px = self.win_w - PANEL_WIDTH
+        self._panel_static = pygame.Surface((PANEL_WIDTH, self.win_h)).convert()
+        
+        # Panel background with subtle gradient effect
+        draw_rounded_rect(self._panel_static, COLORS['PANEL_BG'], self._panel_static.get_rect(), radius=0)
+        pygame.draw.line(self._panel_static, COLORS['PANEL_BORDER'], (0, 0), (0, self.win_h), 1)
+        
+        # Title section
+        title = self.title_font.render("Controls", True, COLORS['TEXT'])
+        self._panel_static.blit(title, (28, 28))
+        
+        self.sliders.draw_static(self._panel_static, self.font, px)
+        self.compass.draw_static(self._panel_static, self.small_font, px)
     
     def _init_forest(self):
         """Initialize forest with current tree density"""
-        self.grid = np.random.choice([CELL_STATES.EMPTY, CELL_STATES.TREE], (GRID_HEIGHT, GRID_WIDTH), p=[1 - self.tree_density, self.tree_density]).astype(np.uint8)
+        self.grid[:] = self._rng.choice([CELL_STATES.EMPTY, CELL_STATES.TREE], (GRID_HEIGHT, GRID_WIDTH), p=[1 - self.tree_density, self.tree_density]).astype(np.uint8)
+        self._mark_dirty()
+    
+    def _mark_dirty(self, y0=0, x0=0, y1=GRID_HEIGHT, x1=GRID_WIDTH):
+        """Queue the screen area of grid cells [y0, y1) x [x0, x1) for the next display update"""
+        cs = self.cell_size
+        self._stats_dirty = True
+        self._dirty_rects.append(pygame.Rect(x0 * cs, self.grid_offset_y + y0 * cs, (x1 - x0) * cs, (y1 - y0) * cs))
     
     # ─── Actions ───
     def _start_fire(self):
         trees = np.argwhere(self.grid == CELL_STATES.TREE)
         if len(trees) > 0:
-            for y, x in trees[np.random.choice(len(trees), min(3, len(trees)), replace=False)]:
+            for y, x in trees[self._rng.choice(len(trees), min(3, len(trees)), replace=False)]:
                 self.grid[y, x] = CELL_STATES.BURNING
+                self._mark_dirty(y, x, y + 1, x + 1)
             self.running = True
     
     def _reset_forest(self):
-        self.tree_density = self.sliders[0].val
+        self.tree_density = self.sliders.vals[0]
         self._init_forest()
         self.running, self.paused = False, False
     
@@ -256,11 +408,8 @@ class ForestFireSimulation:
     def _step_forward(self): self._simulate_step()
     
     def _randomize(self):
-        self.sliders[0].val = np.random.uniform(0.3, 0.8)
-        self.sliders[1].val = np.random.uniform(0, 360)
-        self.sliders[2].val = np.random.uniform(0.2, 0.9)
-        self.sliders[3].val = np.random.uniform(0, 0.4)
-        self.sliders[4].val = np.random.uniform(10, 45)
+        # Density, wind direction, wind strength, moisture, temperature
+        self.sliders.vals[:] = self._rng.uniform([0.3, 0, 0.2, 0, 10], [0.8, 360, 0.9, 0.4, 45])
         self._sync_params()
         self._reset_forest()
     
@@ -272,74 +421,73 @@ class ForestFireSimulation:
         if diff > 180: diff = 360 - diff
         return max(0.1, 1.0 + self.wind_str * math.cos(math.radians(diff)))
     
+    def _grid_stats(self):
+        """(trees, burning, burnt) counts - one bincount pass, only after the grid changed"""
+        if self._stats_dirty:
+            _, trees, burning, burnt = np.bincount(self.grid.ravel(), minlength=4).tolist()
+            self._stats_cache = (trees, burning, burnt)
+            self._stats_dirty = False
+        return self._stats_cache
+    
     def _simulate_step(self):
-        new = self.grid.copy()
-        burning = np.argwhere(self.grid == CELL_STATES.BURNING)
-        new[burning[:, 0], burning[:, 1]] = CELL_STATES.BURNT
-        
-        for by, bx in burning:
-            for dy, dx in [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                ny, nx = by + dy, bx + dx
-                if 0 <= ny < GRID_HEIGHT and 0 <= nx < GRID_WIDTH and self.grid[ny, nx] == CELL_STATES.TREE:
-                    prob = self.fire_prob * self._get_wind_bias(dy, dx) * (1 - self.moisture)
-                    if np.random.random() < prob: new[ny, nx] = CELL_STATES.BURNING
-        
-        self.grid = new
-        if not np.any(self.grid == CELL_STATES.BURNING): self.running = False
+        if self._grid_stats()[1] == 0: self.running = False; return  # Nothing burning, nothing to do
+        # Read the front buffer, write every cell of the back buffer's interior, then swap
+        new = self._padded_back[1:-1, 1:-1]
+        rand = self._rng.random((GRID_HEIGHT, GRID_WIDTH), dtype=np.float32)
+        self._step_kernel(self._padded, new, self.fire_prob, self.moisture, self._wind_bias8, rand)
+        # Only the bounding box of changed cells needs to reach the display
+        changed = new != self.grid
+        self._padded, self._padded_back, self.grid = self._padded_back, self._padded, new
+        rows, cols = np.flatnonzero(changed.any(axis=1)), np.flatnonzero(changed.any(axis=0))
+        if rows.size: self._mark_dirty(int(rows[0]), int(cols[0]), int(rows[-1]) + 1, int(cols[-1]) + 1)
+        if self._grid_stats()[1] == 0: self.running = False
     
     def _sync_params(self):
         """Sync slider values and compute fire spread probability"""
-        self.tree_density, self.wind_dir, self.wind_str = self.sliders[0].val, self.sliders[1].val, self.sliders[2].val
-        self.moisture, self.temperature = self.sliders[3].val, self.sliders[4].val
+        self.tree_density, self.wind_dir, self.wind_str, self.moisture, self.temperature = self.sliders.vals.tolist()
         # Fire probability: increases with temp & wind, decreases with moisture
-        temp_factor = clamp((self.temperature - 10) / 40, 0, 1)  # 0 at 10°C, 1 at 50°C
-        self.fire_prob = clamp(0.15 + 0.5 * temp_factor + 0.2 * self.wind_str - 0.4 * self.moisture, 0.05, 0.95)
+        temp_factor = max(0, min(1, (self.temperature - 10) / 40))  # 0 at 10°C, 1 at 50°C
+        self.fire_prob = max(0.05, min(0.95, 0.15 + 0.5 * temp_factor + 0.2 * self.wind_str - 0.4 * self.moisture))
+        # Wind bias per neighbor direction - only 8 distinct values, rebuilt when the wind changes
+        if (self.wind_dir, self.wind_str) != self._wind_key:
+            self._wind_key = (self.wind_dir, self.wind_str)
+            self._wind_bias8 = np.array([self._get_wind_bias(dy, dx) for dy, dx in NEIGHBORS], dtype=np.float32)
     
     # ─── Rendering ───
     def _draw_grid(self):
-        """Render forest grid with cell coloring"""
-        cell_colors = [COLORS['EMPTY'], COLORS['TREE'], COLORS['BURNING'], COLORS['BURNT']]
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                color = cell_colors[self.grid[y, x]]
-                rect = pygame.Rect(x * self.cell_size, self.grid_offset_y + y * self.cell_size, self.cell_size, self.cell_size)
-                pygame.draw.rect(self.screen, color, rect)
+        """Render forest grid as one palette-mapped image scaled up to cell size"""
+        pygame.surfarray.blit_array(self._grid_surf_small, self._palette[self.grid].swapaxes(0, 1))
+        pygame.transform.scale(self._grid_surf_small, (self.grid_px_w, self.grid_px_h), self._grid_surf_scaled)
+        self.screen.blit(self._grid_surf_scaled, (0, self.grid_offset_y))
     
     def _draw_panel(self):
         """Render control panel with modern card layout"""
         px = self.win_w - PANEL_WIDTH
+        screen, blit, draw_rect = self.screen, self.screen.blit, pygame.draw.rect
         
-        # Panel background with subtle gradient effect
-        draw_rounded_rect(self.screen, COLORS['PANEL_BG'], pygame.Rect(px, 0, PANEL_WIDTH, self.win_h), radius=0)
-        pygame.draw.line(self.screen, COLORS['PANEL_BORDER'], (px, 0), (px, self.win_h), 1)
-        
-        # Title section
-        title = self.title_font.render("Controls", True, COLORS['TEXT'])
-        self.screen.blit(title, (px + 28, 28))
+        # Background, border, title, slider labels and compass dial (pre-rendered)
+        blit(self._panel_static, (px, 0))
         
         # Sliders
-        for s in self.sliders:
-            s.draw(self.screen, self.font, self.small_font)
+        self.sliders.draw(screen, self.small_font)
         
         # Wind compass
-        self.compass.draw(self.screen, self.font, self.small_font, self.wind_dir, self.wind_str)
+        self.compass.draw(screen, self.font, self.small_font, self.wind_dir, self.wind_str)
         
         # Buttons
-        for b in self.buttons: b.draw(self.screen, self.font)
+        for b in self.buttons: b.draw(screen, self.font)
         
         # Stats card
         card_rect = pygame.Rect(px + 20, self.stats_y, PANEL_WIDTH - 40, 130)
-        draw_rounded_rect(self.screen, COLORS['CARD_BG'], card_rect, radius=12)
+        draw_rounded_rect(screen, COLORS['CARD_BG'], card_rect, radius=12)
         
         # Fire probability (computed, read-only) - prominent display
         prob_label = self.font.render("Fire Spread Probability", True, COLORS['TEXT'])
-        self.screen.blit(prob_label, (px + 32, self.stats_y + 12))
+        blit(prob_label, (px + 32, self.stats_y + 12))
         prob_val = self.stat_font.render(f"{self.fire_prob:.0%}", True, COLORS['DANGER'])
-        self.screen.blit(prob_val, (px + PANEL_WIDTH - 72, self.stats_y + 12))
+        blit(prob_val, (px + PANEL_WIDTH - 72, self.stats_y + 12))
         
-        trees = np.sum(self.grid == CELL_STATES.TREE)
-        burning = np.sum(self.grid == CELL_STATES.BURNING)
-        burnt = np.sum(self.grid == CELL_STATES.BURNT)
+        trees, burning, burnt = self._grid_stats()
         total = GRID_WIDTH * GRID_HEIGHT
         
         stats = [
@@ -348,23 +496,36 @@ class ForestFireSimulation:
             (f"⬛ Burnt: {burnt}", COLORS['TEXT_DIM'], burnt / total),
         ]
         
-        sy = self.stats_y + 44
+        sy, render = self.stats_y + 44, self.stat_font.render
         for i, (txt, clr, pct) in enumerate(stats):
-            self.screen.blit(self.stat_font.render(txt, True, clr), (px + 32, sy + i * 28))
+            blit(render(txt, True, clr), (px + 32, sy + i * 28))
             bar_rect = pygame.Rect(px + 160, sy + i * 28 + 4, 100, 8)
-            pygame.draw.rect(self.screen, COLORS['SLIDER_BG'], bar_rect, border_radius=4)
+            draw_rect(screen, COLORS['SLIDER_BG'], bar_rect, border_radius=4)
             if pct > 0:
                 fill_rect = pygame.Rect(bar_rect.x, bar_rect.y, int(bar_rect.width * pct), bar_rect.height)
-                pygame.draw.rect(self.screen, clr, fill_rect, border_radius=4)
+                draw_rect(screen, clr, fill_rect, border_radius=4)
 
     
+    def _present(self):
+        """Update only dirty grid areas plus the panel, or flip when most of the grid changed"""
+        dirty_px = sum(r.w * r.h for r in self._dirty_rects)
+        if self._full_redraw or dirty_px > self.grid_px_w * self.grid_px_h // 2:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._dirty_rects + [self._panel_rect])
+        self._dirty_rects.clear()
+        self._full_redraw = False
+    
     # ─── Event Handling ───
     def _handle_events(self):
         for e in pygame.event.get():
             if e.type == pygame.QUIT: return False
             if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE: return False
+            # Window shown again (alt-tab, restore, overlay gone) - the whole screen must be pushed
+            if e.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWFOCUSGAINED, pygame.VIDEOEXPOSE):
+                self._full_redraw = True
             
-            for s in self.sliders: s.handle_event(e)
+            self.sliders.handle_event_all(e)
             for b in self.buttons: b.handle_event(e)
             
             # Click grid to ignite
@@ -374,6 +535,7 @@ class ForestFireSimulation:
                     gx, gy = mx // self.cell_size, (my - self.grid_offset_y) // self.cell_size
                     if 0 <= gx < GRID_WIDTH and 0 <= gy < GRID_HEIGHT and self.grid[gy, gx] == CELL_STATES.TREE:
                         self.grid[gy, gx] = CELL_STATES.BURNING
+                        self._mark_dirty(gy, gx, gy + 1, gx + 1)
                         self.running = True
         return True
     
@@ -393,7 +555,7 @@ class ForestFireSimulation:
             self.screen.fill(COLORS['BG'])
             self._draw_grid()
             self._draw_panel()
-            pygame.display.flip()
+            self._present()
             self.clock.tick(FPS)
         
         pygame.quit()